@@ -1,17 +1,50 @@
 #!/usr/bin/env python3
+import hashlib
 import json
-import math
 import os
 import sys
 from pathlib import Path
-from collections import defaultdict, Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import escape
 
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 OUTPUT_DIR = Path('artifacts/reports')
+LOAD_WORKERS = 32  # upper bound; the pool never exceeds the file count
+STREAM_MIN_BYTES = 10 * 1024 * 1024  # stream-parse run files at least this large
+
+# chart output: ARCH_DPI=200 for publication-quality images; the PNGs skip the
+# Software tag and use fast zlib compression
+SAVE_KW = {
+    'dpi': int(os.environ.get('ARCH_DPI', '120')),
+    'metadata': {'Software': None},
+    'pil_kwargs': {'compress_level': 1},
+}
+
+# 'svg' writes the same chart set as plain SVG without importing matplotlib
+PLOT_BACKEND = os.environ.get('ARCH_PLOT_BACKEND', 'mpl')
+BAR_COLORS = ['#7aa6c2', '#4f7fa3', '#2b5c84']
+
+CHART_NAMES = (
+    'architecture_benchmark_matrix_multi.png',
+    'architecture_benchmark_model_totals_multi.png',
+    'architecture_benchmark_model_stacked_multi.png',
+    'architecture_benchmark_sandbox_totals_multi.png',
+    'architecture_benchmark_summary_multi.png',
+    'architecture_benchmark_rubric_model.png',
+    'architecture_benchmark_cost_curve.png',
+)
 
 PRICE_USD_PER_M = {
     'claude-3-5-haiku-20241022': {'input': 0.07, 'output': 0.30},
@@ -23,6 +56,8 @@ PRICE_USD_PER_M = {
     'x-ai/grok-code-fast-1': {'input': 0.20, 'output': 1.50},
     'arcee-ai/trinity-large-preview:free': {'input': 0.00, 'output': 0.00},
 }
+INPUT_RATE = {model: rate['input'] for model, rate in PRICE_USD_PER_M.items()}
+OUTPUT_RATE = {model: rate['output'] for model, rate in PRICE_USD_PER_M.items()}
 
 KEY_FILES = {
     'app-typed': [
@@ -72,12 +107,15 @@ KEY_FILES = {
 def parse_args():
     input_dir = None
     suffix = None
+    force = False
     for arg in sys.argv[1:]:
         if arg.startswith('--input='):
             input_dir = Path(arg.split('=', 1)[1])
         elif arg.startswith('--suffix='):
             suffix = arg.split('=', 1)[1]
-    return input_dir, suffix
+        elif arg == '--force':
+            force = True
+    return input_dir, suffix, force
 
 
 def latest_runs_dir():
@@ -85,6 +123,7 @@ def latest_runs_dir():
     return candidates[-1] if candidates else None
 
 
+@lru_cache(maxsize=64)
 def apply_suffix(name, suffix):
     if not suffix:
         return name
@@ -92,95 +131,218 @@ def apply_suffix(name, suffix):
     return f'{stem}_{suffix}{ext}'
 
 
-def load_runs(input_dir):
-    runs = []
-    if not input_dir.exists():
-        return runs
+def runs_fingerprint(input_dir):
+    # name, mtime and size of every run file; any added, removed or
+    # rewritten run changes the digest without opening the files. The output
+    # settings and this script are folded in too, so switching ARCH_DPI or
+    # ARCH_PLOT_BACKEND, or editing the script, forces a rebuild
+    entries = []
     for path in sorted(input_dir.glob('*.json')):
-        with path.open() as f:
-            payload = json.load(f)
-        runs.append(payload)
-    return runs
-
-
-def extract_run_usage(payload):
-    usage = payload.get('metadata', {}).get('tokenUsage')
-    if usage and isinstance(usage, dict):
-        return {
-            'inputTokens': usage.get('inputTokens', 0) or 0,
-            'outputTokens': usage.get('outputTokens', 0) or 0,
-            'totalTokens': usage.get('totalTokens', 0) or 0,
-        }
+        st = path.stat()
+        entries.append((path.name, st.st_mtime_ns, st.st_size))
+    key = repr((input_dir.resolve().as_posix(), entries, SAVE_KW, PLOT_BACKEND)).encode()
+    h = hashlib.blake2b(key)
+    h.update(Path(__file__).read_bytes())
+    return h.hexdigest()
+
+
+def slim_result(r):
+    # keep only the fields summarize_runs reads; the same few sandbox, task
+    # and file names repeat across every result, so share one copy of each
+    usage = r.get('toolUsage') or {}
+    rubric = r.get('rubric') or {}
+    return {
+        'sandbox': sys.intern(r['sandbox']),
+        'task': {'id': sys.intern(r['task']['id'])},
+        'pass': r.get('pass'),
+        'toolUsage': {'readFiles': [sys.intern(file) for file in usage.get('readFiles') or []]},
+        'tokenUsage': r.get('tokenUsage'),
+        'rubric': {'total': rubric.get('total')} if rubric else {},
+    }
 
-    input_tokens = 0
-    output_tokens = 0
-    total_tokens = 0
-    for r in payload.get('results', []):
-        usage = r.get('tokenUsage') or {}
-        input_tokens += usage.get('inputTokens', 0) or 0
-        output_tokens += usage.get('outputTokens', 0) or 0
-        total_tokens += usage.get('totalTokens', 0) or 0
-
-    if input_tokens or output_tokens or total_tokens:
-        return {
-            'inputTokens': input_tokens,
-            'outputTokens': output_tokens,
-            'totalTokens': total_tokens,
-        }
-    return None
 
+def stream_run(path):
+    # decode one result at a time and drop everything summarize_runs ignores
+    with path.open('rb') as f:
+        metadata = next(ijson.items(f, 'metadata', use_float=True), {})
+    with path.open('rb') as f:
+        results = [slim_result(r) for r in ijson.items(f, 'results.item', use_float=True)]
+    return {'metadata': metadata, 'results': results}
 
-def summarize_runs(runs):
-    # data structures
-    pass_counts = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
-    run_counts = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
-    run_totals = defaultdict(list)  # model -> list of total passes per run
-    run_token_usage = defaultdict(list)
 
-    tool_reads = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
-    rubric_sums = defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
-    rubric_counts = defaultdict(lambda: defaultdict(lambda: defaultdict(int)))
+def load_run(path):
+    if ijson is not None and path.stat().st_size >= STREAM_MIN_BYTES:
+        return stream_run(path)
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open() as f:
+        return json.load(f)
+
+
+def load_runs(input_dir):
+    if not input_dir.exists():
+        return []
+    paths = sorted(input_dir.glob('*.json'))
+    if not paths:
+        return []
+    # file reads overlap across threads; map() keeps the sorted order
+    with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(paths))) as pool:
+        return list(pool.map(load_run, paths))
+
+
+def summarize_runs(runs, models, sandboxes, tasks):
+    # integer codes for the (model, sandbox, task) grid
+    model_idx = {model: i for i, model in enumerate(models)}
+    sandbox_idx = {sandbox: i for i, sandbox in enumerate(sandboxes)}
+    task_idx = {task: i for i, task in enumerate(tasks)}
+    shape = (len(models), len(sandboxes), len(tasks))
+
+    # data structures
+    cell_codes = []  # flat grid index per result
+    cell_passed = []  # 0/1 per result
+    rubric_codes = []  # flat grid index per result with a rubric
+    rubric_totals = []  # rubric total per result with a rubric
+    read_counts = []  # files read per result
+    unique_read_counts = []  # distinct files read per result
+    hit_pairs = []  # flat (model, sandbox) index per distinct file read
+    hit_files = []  # file id per distinct file read
+    file_index = {}  # file path -> integer id
+    run_totals = {model: [] for model in models}  # model -> list of total passes per run
+    run_token_usage = {model: [] for model in models}  # model -> token usage per run
 
     for payload in runs:
         model = payload['metadata']['model']
         results = payload['results']
+        mi = model_idx[model]
+
+        # run-level token usage wins; otherwise sum the per-result usage
+        # in the same pass as everything else
+        run_usage = payload['metadata'].get('tokenUsage')
+        if not isinstance(run_usage, dict):
+            run_usage = None
+        total_pass = 0  # total passes per run (out of 9)
+        input_tokens = 0
+        output_tokens = 0
+        total_tokens = 0
 
-        # total passes per run (out of 9)
-        total_pass = sum(1 for r in results if r.get('pass'))
-        run_totals[model].append(total_pass)
+        for r in results:
+            passed = 1 if r.get('pass') else 0
+            total_pass += passed
 
-        run_token_usage[model].append(extract_run_usage(payload))
+            if not run_usage:
+                usage = r.get('tokenUsage') or {}
+                input_tokens += usage.get('inputTokens', 0) or 0
+                output_tokens += usage.get('outputTokens', 0) or 0
+                total_tokens += usage.get('totalTokens', 0) or 0
 
-        for r in results:
             sandbox = r['sandbox']
             task = r['task']['id']
-            passed = 1 if r.get('pass') else 0
 
-            pass_counts[model][sandbox][task] += passed
-            run_counts[model][sandbox][task] += 1
+            si = sandbox_idx.get(sandbox)
+            ti = task_idx.get(task)
+            if si is not None and ti is not None:
+                code = (mi * shape[1] + si) * shape[2] + ti
+                cell_codes.append(code)
+                cell_passed.append(passed)
+
+                rubric = r.get('rubric') or {}
+                if rubric:
+                    rubric_codes.append(code)
+                    rubric_totals.append(rubric.get('total', 0.0) or 0.0)
+
+                usage = r.get('toolUsage') or {}
+                reads = usage.get('readFiles') or []
+                unique_ids = {file_index.setdefault(file, len(file_index)) for file in reads}
+                read_counts.append(len(reads))
+                unique_read_counts.append(len(unique_ids))
+                hit_pairs.extend([mi * shape[1] + si] * len(unique_ids))
+                hit_files.extend(unique_ids)
+
+        run_totals[model].append(total_pass)
+        if run_usage:
+            run_token_usage[model].append({
+                'inputTokens': run_usage.get('inputTokens', 0) or 0,
+                'outputTokens': run_usage.get('outputTokens', 0) or 0,
+                'totalTokens': run_usage.get('totalTokens', 0) or 0,
+            })
+        elif input_tokens or output_tokens or total_tokens:
+            run_token_usage[model].append({
+                'inputTokens': input_tokens,
+                'outputTokens': output_tokens,
+                'totalTokens': total_tokens,
+            })
+        else:
+            run_token_usage[model].append(None)
+
+    size = len(models) * len(sandboxes) * len(tasks)
+    codes = np.array(cell_codes, dtype=np.intp)
+    pass_counts = np.bincount(codes, weights=cell_passed, minlength=size).astype(np.int64).reshape(shape)
+    run_counts = np.bincount(codes, minlength=size).reshape(shape)
+
+    # tool usage per (model, sandbox); file_hits counts results that read
+    # each file at least once
+    n_pairs = len(models) * len(sandboxes)
+    n_files = len(file_index)
+    pair_codes = codes // shape[2]
+    hit_codes = np.array(hit_pairs, dtype=np.intp) * n_files + np.array(hit_files, dtype=np.intp)
+    tool_usage = {
+        'reads': np.bincount(pair_codes, weights=read_counts, minlength=n_pairs).reshape(shape[:2]),
+        'unique_reads': np.bincount(pair_codes, weights=unique_read_counts, minlength=n_pairs).reshape(shape[:2]),
+        'file_hits': np.bincount(hit_codes, minlength=n_pairs * n_files).reshape(shape[:2] + (n_files,)),
+    }
+
+    codes = np.array(rubric_codes, dtype=np.intp)
+    rubric_sums = np.bincount(codes, weights=rubric_totals, minlength=size).reshape(shape)
+    rubric_counts = np.bincount(codes, minlength=size).reshape(shape)
+
+    return pass_counts, run_counts, run_totals, tool_usage, file_index, run_token_usage, rubric_sums, rubric_counts
+
+
+def clopper_pearson(k, n, alpha=0.05):
+    # exact binomial interval, elementwise over arrays of successes/trials;
+    # scipy is imported here so the skip and svg paths never load it
+    from scipy import stats
+
+    n = np.asarray(n, dtype=float)
+    k = np.minimum(np.asarray(k, dtype=float), n)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        lo = stats.beta.ppf(alpha / 2, k, n - k + 1)
+        hi = stats.beta.ppf(1 - alpha / 2, k + 1, n - k)
+    lo = np.where(k == 0, 0.0, lo)
+    hi = np.where(k >= n, 1.0, hi)
+    empty = n == 0
+    return np.where(empty, 0.0, lo), np.where(empty, 0.0, hi)
+
 
-            usage = r.get('toolUsage') or {}
-            reads = usage.get('readFiles') or []
-            tool_reads[model][sandbox][task].append(reads)
+def ratio(num, den):
+    # elementwise num / den, zero where den is zero
+    return np.divide(num, den, out=np.zeros(np.shape(den), dtype=float), where=den > 0)
 
-            rubric = r.get('rubric') or {}
-            if rubric:
-                rubric_sums[model][sandbox][task] += rubric.get('total', 0.0) or 0.0
-                rubric_counts[model][sandbox][task] += 1
 
-    return pass_counts, run_counts, run_totals, tool_reads, run_token_usage, rubric_sums, rubric_counts
+def running_std(totals):
+    # population std of each prefix totals[:i], Welford's online update
+    out = np.empty(totals.shape[0])
+    mean = 0.0
+    m2 = 0.0
+    for i in range(totals.shape[0]):
+        x = totals[i]
+        delta = x - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x - mean)
+        out[i] = np.sqrt(m2 / (i + 1))
+    return out
 
 
-def binom_ci(p, n, z=1.96):
-    if n == 0:
-        return (0.0, 0.0)
-    se = math.sqrt(max(p * (1 - p) / n, 0.0))
-    lo = max(0.0, p - z * se)
-    hi = min(1.0, p + z * se)
-    return (lo, hi)
+def cost_from_usage(model, usage):
+    input_rate = INPUT_RATE.get(model)
+    if not usage or input_rate is None:
+        return None
+    input_cost = (usage.get('inputTokens', 0) / 1_000_000) * input_rate
+    output_cost = (usage.get('outputTokens', 0) / 1_000_000) * OUTPUT_RATE[model]
+    return input_cost + output_cost
 
 
-def build_summary(pass_counts, run_counts, run_totals, tool_reads, run_token_usage,
+def build_summary(pass_counts, run_counts, run_totals, tool_usage, file_index, run_token_usage,
                   rubric_sums, rubric_counts, models, sandboxes, tasks):
     summary = {
         'models': models,
@@ -190,15 +352,55 @@ def build_summary(pass_counts, run_counts, run_totals, tool_reads, run_token_usa
         'per_model': {},
     }
 
-    def cost_from_usage(model, usage):
-        if not usage or model not in PRICE_USD_PER_M:
-            return None
-        rate = PRICE_USD_PER_M[model]
-        input_cost = (usage.get('inputTokens', 0) / 1_000_000) * rate['input']
-        output_cost = (usage.get('outputTokens', 0) / 1_000_000) * rate['output']
-        return input_cost + output_cost
+    # per-cell pass rates, zero where a cell has no runs
+    pass_rate = ratio(pass_counts, run_counts)
+
+    # confidence intervals for every (model, sandbox, task) cell in one pass,
+    # with [lo, hi] on the last axis
+    cell_ci = np.stack(clopper_pearson(pass_counts, run_counts), axis=-1)
+
+    sandbox_passes = pass_counts.sum(axis=2)
+    # the intervals count every task result that was actually recorded, so a
+    # run missing a result can't leave more passes than trials
+    sandbox_trials = run_counts[:, :, 0] * len(tasks)
+    sandbox_ci = np.stack(clopper_pearson(sandbox_passes, run_counts.sum(axis=2)), axis=-1)
+    model_passes = sandbox_passes.sum(axis=1)
+    model_trials = sandbox_trials.sum(axis=1)
+    overall_ci = np.stack(clopper_pearson(model_passes, run_counts.sum(axis=(1, 2))), axis=-1)
+
+    # file ids of each sandbox's key files (None if never read)
+    key_file_ids = {
+        sandbox: [(key, file_index.get(key)) for key in KEY_FILES.get(sandbox, [])]
+        for sandbox in sandboxes
+    }
 
-    for model in models:
+    # mean passes per sandbox (out of 3), shared with plot_charts
+    matrix = ratio(sandbox_passes, run_counts[:, :, 0])
+
+    # mean rubric score per (model, sandbox)
+    rubric_n = rubric_counts.sum(axis=2)
+    rubric_mean = ratio(rubric_sums.sum(axis=2), rubric_n)
+
+    # tool usage per (model, sandbox), averaged over task results
+    tool_tasks = run_counts.sum(axis=2)
+    file_hits = tool_usage['file_hits']
+
+    # the dict-building loop below indexes plain Python lists rather than
+    # converting NumPy scalars one cell at a time
+    rate_rows = pass_rate.tolist()
+    pass_rows = pass_counts.tolist()
+    run_rows = run_counts.tolist()
+    cell_ci_rows = cell_ci.tolist()
+    sandbox_ci_rows = sandbox_ci.tolist()
+    overall_ci_rows = overall_ci.tolist()
+    matrix_rows = matrix.tolist()
+    rubric_mean_rows = rubric_mean.tolist()
+    rubric_n_rows = rubric_n.tolist()
+    tool_task_rows = tool_tasks.tolist()
+    avg_reads_rows = ratio(tool_usage['reads'], tool_tasks).tolist()
+    avg_unique_reads_rows = ratio(tool_usage['unique_reads'], tool_tasks).tolist()
+
+    for mi, model in enumerate(models):
         model_entry = {
             'sandbox_task_pass_rate': {},
             'sandbox_passes_mean': {},
@@ -211,84 +413,41 @@ def build_summary(pass_counts, run_counts, run_totals, tool_reads, run_token_usa
             'cost': {},
         }
 
-        overall_total = 0
-        overall_n = 0
-
-        for sandbox in sandboxes:
-            # per task pass rate + rubric
-            task_rates = {}
-            task_counts = 0
-            task_passes = 0
-            task_rubric_total = 0.0
-            task_rubric_n = 0
-            for task in tasks:
-                n = run_counts[model][sandbox][task]
-                c = pass_counts[model][sandbox][task]
-                p = c / n if n else 0.0
-                task_rates[task] = {
-                    'pass_rate': p,
-                    'passes': c,
-                    'runs': n,
-                    'ci95': binom_ci(p, n),
-                }
-                task_counts += n
-                task_passes += c
-
-                rubric_n = rubric_counts[model][sandbox][task]
-                rubric_total = rubric_sums[model][sandbox][task]
-                task_rubric_total += rubric_total
-                task_rubric_n += rubric_n
-
-            model_entry['sandbox_task_pass_rate'][sandbox] = task_rates
-
-            # mean passes per sandbox (out of 3)
-            n_runs = run_counts[model][sandbox][tasks[0]]
-            passes_mean = task_passes / n_runs if n_runs else 0.0
-            model_entry['sandbox_passes_mean'][sandbox] = passes_mean
+        for si, sandbox in enumerate(sandboxes):
+            # per task pass rate
+            cells = zip(tasks, rate_rows[mi][si], pass_rows[mi][si], run_rows[mi][si], cell_ci_rows[mi][si])
+            model_entry['sandbox_task_pass_rate'][sandbox] = {
+                task: {'pass_rate': p, 'passes': c, 'runs': n, 'ci95': tuple(ci)}
+                for task, p, c, n, ci in cells
+            }
 
             # CI on average pass rate across tasks
-            total_trials = n_runs * len(tasks)
-            p_total = task_passes / total_trials if total_trials else 0.0
-            ci = binom_ci(p_total, total_trials)
-            model_entry['sandbox_passes_ci'][sandbox] = ci
-
-            overall_total += task_passes
-            overall_n += total_trials
+            model_entry['sandbox_passes_ci'][sandbox] = tuple(sandbox_ci_rows[mi][si])
 
-            rubric_mean = (task_rubric_total / task_rubric_n) if task_rubric_n else 0.0
             model_entry['rubric'][sandbox] = {
-                'mean': rubric_mean,
-                'runs': task_rubric_n,
+                'mean': rubric_mean_rows[mi][si],
+                'runs': rubric_n_rows[mi][si],
             }
 
-        overall_p = overall_total / overall_n if overall_n else 0.0
+        model_entry['sandbox_passes_mean'] = dict(zip(sandboxes, matrix_rows[mi]))
+
+        overall_n = int(model_trials[mi])
+        overall_p = int(model_passes[mi]) / overall_n if overall_n else 0.0
         model_entry['overall_passes_mean'] = overall_p * len(sandboxes) * len(tasks)
-        model_entry['overall_passes_ci'] = binom_ci(overall_p, overall_n)
+        model_entry['overall_passes_ci'] = tuple(overall_ci_rows[mi])
 
         # tool usage summary
         tool_summary = {}
-        for sandbox in sandboxes:
-            file_hits = Counter()
-            total_reads = 0
-            total_unique_reads = 0
-            total_tasks = 0
-
-            for task in tasks:
-                for reads in tool_reads[model][sandbox][task]:
-                    total_tasks += 1
-                    total_reads += len(reads)
-                    unique_reads = set(reads)
-                    total_unique_reads += len(unique_reads)
-                    for file in unique_reads:
-                        file_hits[file] += 1
-
+        for si, sandbox in enumerate(sandboxes):
+            total_tasks = tool_task_rows[mi][si]
             key_file_rates = {}
-            for key in KEY_FILES.get(sandbox, []):
-                key_file_rates[key] = (file_hits.get(key, 0) / total_tasks) if total_tasks else 0.0
+            for key, file_id in key_file_ids[sandbox]:
+                hits = int(file_hits[mi, si, file_id]) if file_id is not None else 0
+                key_file_rates[key] = (hits / total_tasks) if total_tasks else 0.0
 
             tool_summary[sandbox] = {
-                'avg_reads_per_task': total_reads / total_tasks if total_tasks else 0.0,
-                'avg_unique_reads_per_task': total_unique_reads / total_tasks if total_tasks else 0.0,
+                'avg_reads_per_task': avg_reads_rows[mi][si],
+                'avg_unique_reads_per_task': avg_unique_reads_rows[mi][si],
                 'key_file_read_rate': key_file_rates,
             }
 
@@ -296,14 +455,17 @@ def build_summary(pass_counts, run_counts, run_totals, tool_reads, run_token_usa
 
         # cost summary
         costs = []
-        tokens = []
-        for usage in run_token_usage.get(model, []):
-            tokens.append(usage)
-            cost = cost_from_usage(model, usage) if usage else None
+        tokens = run_token_usage.get(model, [])
+        cost_sum = 0.0
+        cost_n = 0
+        for usage in tokens:
+            cost = cost_from_usage(model, usage)
             costs.append(cost)
+            if cost is not None:
+                cost_sum += cost
+                cost_n += 1
 
-        known_costs = [c for c in costs if c is not None]
-        cost_mean = sum(known_costs) / len(known_costs) if known_costs else None
+        cost_mean = cost_sum / cost_n if cost_n else None
         overall_passes = model_entry['overall_passes_mean']
         cost_per_pass = (cost_mean / overall_passes) if cost_mean is not None and overall_passes else None
 
@@ -319,77 +481,315 @@ def build_summary(pass_counts, run_counts, run_totals, tool_reads, run_token_usa
     # plateau analysis
     plateau = {}
     for model, totals in run_totals.items():
-        running_std = []
-        for i in range(1, len(totals) + 1):
-            vals = totals[:i]
-            mean = sum(vals) / i
-            var = sum((v - mean) ** 2 for v in vals) / i
-            running_std.append(math.sqrt(var))
         plateau[model] = {
             'run_totals': totals,
-            'running_std': running_std,
+            'running_std': running_std(np.asarray(totals, dtype=np.float64)),
         }
     summary['plateau'] = plateau
 
+    # plotting inputs; underscore keys are not written to the JSON summary
+    summary['_matrix_mean_passes'] = matrix
+    summary['_matrix_observed'] = run_counts[:, :, 0] > 0
+    summary['_model_totals'] = matrix.sum(axis=1)
+    summary['_sandbox_totals'] = matrix.sum(axis=0)
+    summary['_rubric_model_means'] = rubric_mean.sum(axis=1) / max(len(sandboxes), 1)
+
     return summary
 
 
 def write_summary(summary, suffix=None):
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     out_path = OUTPUT_DIR / apply_suffix('architecture_sampling_summary.json', suffix)
+    public = {key: value for key, value in summary.items() if not key.startswith('_')}
+    if orjson is not None:
+        out_path.write_bytes(orjson.dumps(public, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        return out_path
     with out_path.open('w') as f:
-        json.dump(summary, f, indent=2)
+        json.dump(public, f, indent=2, allow_nan=False, default=lambda value: value.tolist())
     return out_path
 
 
+def reset_figure(fig, figsize, ncols=1):
+    fig.clear()
+    fig.set_size_inches(*figsize)
+    return fig.subplots(1, ncols)
+
+
+def chart_digest(*inputs):
+    h = hashlib.blake2b(digest_size=16)
+    for value in inputs:
+        if isinstance(value, np.ndarray):
+            h.update(repr((value.dtype.str, value.shape)).encode())
+            h.update(value.tobytes())
+        else:
+            h.update(repr(value).encode())
+    return h.hexdigest()
+
+
+def svg_document(width, height, body):
+    head = (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+            f'viewBox="0 0 {width:.0f} {height:.0f}" font-family="sans-serif" font-size="11">')
+    return '\n'.join([head, '<rect width="100%" height="100%" fill="white"/>', *body, '</svg>\n'])
+
+
+def bar_chart_svg(labels, series, ymax, title, ylabel=''):
+    # series is a list of (name, values, color) stacked bottom-up; a single
+    # unnamed series colours each bar from BAR_COLORS and labels its value.
+    # Returns (width, height, body) so panes can be composed
+    bar_w, gap, plot_h = 44, 14, 220
+    # labels are rotated and end-anchored, so the longest one sets the
+    # left margin and the space below the axis
+    longest = max((len(label) for label in labels), default=0)
+    left = max(56, round(5.5 * longest) - gap)
+    right, top, bottom = 16, 36, max(60, round(3.2 * longest) + 30)
+    plot_w = len(labels) * (bar_w + gap) + gap
+    width = max(left + plot_w + right, 8 * len(title))
+    base = top + plot_h
+    body = [
+        f'<text x="{width / 2:.1f}" y="22" text-anchor="middle" font-size="13">{escape(title)}</text>',
+        f'<text transform="translate({left - 36} {top + plot_h / 2:.1f}) rotate(-90)" '
+        f'text-anchor="middle">{escape(ylabel)}</text>',
+        f'<line x1="{left}" y1="{top}" x2="{left}" y2="{base}" stroke="black"/>',
+        f'<line x1="{left}" y1="{base}" x2="{left + plot_w}" y2="{base}" stroke="black"/>',
+    ]
+    for tick in (0.0, 0.5, 1.0):
+        y = base - tick * plot_h
+        body.append(f'<text x="{left - 4}" y="{y + 4:.1f}" text-anchor="end">{tick * ymax:g}</text>')
+    stacked = len(series) > 1
+    bottoms = [0.0] * len(labels)
+    for name, values, color in series:
+        for i, value in enumerate(values):
+            y0 = plot_h * min(max(bottoms[i] / ymax, 0.0), 1.0) if ymax else 0.0
+            y1 = plot_h * min(max((bottoms[i] + value) / ymax, 0.0), 1.0) if ymax else 0.0
+            bottoms[i] += value
+            x = left + gap + i * (bar_w + gap)
+            fill = color or BAR_COLORS[i % len(BAR_COLORS)]
+            body.append(f'<rect x="{x}" y="{base - y1:.1f}" width="{bar_w}" height="{y1 - y0:.1f}" fill="{fill}"/>')
+            if not stacked:
+                body.append(f'<text x="{x + bar_w / 2:.1f}" y="{base - y1 - 4:.1f}" '
+                            f'text-anchor="middle">{value:.2f}</text>')
+    for i, label in enumerate(labels):
+        cx = left + gap + i * (bar_w + gap) + bar_w / 2
+        body.append(f'<text transform="translate({cx:.1f} {base + 14}) rotate(-30)" '
+                    f'text-anchor="end">{escape(label)}</text>')
+    if stacked:
+        for k, (name, _, color) in enumerate(series):
+            y = top + 4 + 16 * k
+            body.append(f'<rect x="{left + plot_w - 110}" y="{y}" width="10" height="10" fill="{color}"/>')
+            body.append(f'<text x="{left + plot_w - 96}" y="{y + 9}">{escape(name)}</text>')
+    return width, top + plot_h + bottom, body
+
+
+def render_bar_svg(labels, values, ymax, title, ylabel=''):
+    return svg_document(*bar_chart_svg(labels, [(None, values, None)], ymax, title, ylabel))
+
+
+def render_stacked_bar_svg(labels, series, ymax, title, ylabel=''):
+    return svg_document(*bar_chart_svg(labels, series, ymax, title, ylabel))
+
+
+def render_panes_svg(*panes):
+    # (width, height, body) panes side by side, as the two-axes summary chart
+    body = []
+    x = 0
+    for width, _, pane in panes:
+        body.extend([f'<g transform="translate({x:.0f} 0)">', *pane, '</g>'])
+        x += width
+    return svg_document(x, max((pane[1] for pane in panes), default=0), body)
+
+
+def render_scatter_svg(points, ymax, title, xlabel, ylabel):
+    # points are (x, y, label); x runs from zero to the largest value, padded
+    # on both sides by half the longest label so centred labels stay inside
+    pad = 3 * max((len(point[2]) for point in points), default=0) + 8
+    left, right, top, bottom = 56, 16, 36, 44
+    plot_w, plot_h = 380 + 2 * pad, 220
+    width = max(left + plot_w + right, 8 * len(title))
+    base = top + plot_h
+    xmax = max((point[0] for point in points), default=0.0) or 1.0
+    body = [
+        f'<text x="{width / 2:.1f}" y="22" text-anchor="middle" font-size="13">{escape(title)}</text>',
+        f'<text transform="translate({left - 36} {top + plot_h / 2:.1f}) rotate(-90)" '
+        f'text-anchor="middle">{escape(ylabel)}</text>',
+        f'<text x="{left + plot_w / 2:.1f}" y="{base + 36}" text-anchor="middle">{escape(xlabel)}</text>',
+        f'<line x1="{left}" y1="{top}" x2="{left}" y2="{base}" stroke="black"/>',
+        f'<line x1="{left}" y1="{base}" x2="{left + plot_w}" y2="{base}" stroke="black"/>',
+    ]
+    for tick in (0.0, 0.5, 1.0):
+        y = base - tick * plot_h
+        x = left + pad + tick * (plot_w - 2 * pad)
+        body.append(f'<text x="{left - 4}" y="{y + 4:.1f}" text-anchor="end">{tick * ymax:g}</text>')
+        body.append(f'<line x1="{x:.1f}" y1="{base}" x2="{x:.1f}" y2="{base + 4}" stroke="black"/>')
+        body.append(f'<text x="{x:.1f}" y="{base + 16}" text-anchor="middle">{tick * xmax:.3g}</text>')
+    for px, py, label in points:
+        x = left + pad + (plot_w - 2 * pad) * px / xmax
+        y = base - (plot_h * min(max(py / ymax, 0.0), 1.0) if ymax else 0.0)
+        body.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="4" fill="#2b5c84"/>')
+        body.append(f'<text x="{x:.1f}" y="{y - 8:.1f}" text-anchor="middle" font-size="9">{escape(label)}</text>')
+    return svg_document(width, top + plot_h + bottom, body)
+
+
+def render_heatmap_svg(matrix, observed, rows, cols, vmax, title):
+    cell = max(72, 7 * max((len(col) for col in cols), default=0) + 12)
+    left = 7 * max((len(row) for row in rows), default=0) + 16
+    top, bottom = 36, 40
+    width = max(left + cell * len(cols) + 16, 8 * len(title))
+    body = [f'<text x="{width / 2:.1f}" y="22" text-anchor="middle" font-size="13">{escape(title)}</text>']
+    # linear ramp over the ends of matplotlib's Blues colormap
+    light = np.array([247, 251, 255])
+    dark = np.array([8, 48, 107])
+    shade = np.clip(np.asarray(matrix, dtype=float) / vmax, 0, 1) if vmax else np.zeros(np.shape(matrix))
+    for i, row in enumerate(rows):
+        y = top + i * cell
+        body.append(f'<text x="{left - 6}" y="{y + cell / 2 + 4:.1f}" text-anchor="end">{escape(row)}</text>')
+        for j in range(len(cols)):
+            t = shade[i, j]
+            r, g, b = (light + (dark - light) * t).round().astype(int)
+            x = left + j * cell
+            body.append(f'<rect x="{x}" y="{y}" width="{cell}" height="{cell}" fill="rgb({r},{g},{b})"/>')
+            if observed[i, j]:
+                color = 'white' if t > 0.6 else 'black'
+                body.append(f'<text x="{x + cell / 2:.1f}" y="{y + cell / 2 + 4:.1f}" text-anchor="middle" '
+                            f'fill="{color}">{matrix[i][j]:.2f}/3</text>')
+    for j, col in enumerate(cols):
+        x = left + j * cell + cell / 2
+        body.append(f'<text x="{x:.1f}" y="{top + len(rows) * cell + 16}" text-anchor="middle">{escape(col)}</text>')
+    return svg_document(width, top + len(rows) * cell + bottom, body)
+
+
+def plot_charts_svg(summary, suffix=None):
+    models = summary['models']
+    sandboxes = summary['sandboxes']
+    tasks = summary['tasks']
+    matrix = summary['_matrix_mean_passes']
+    model_totals = summary['_model_totals']
+    sandbox_totals = summary['_sandbox_totals']
+    model_max = len(sandboxes) * len(tasks)
+    sandbox_max = len(models) * len(tasks)
+
+    stack_colors = ['#5e8aa8', '#7aa6c2', '#9bbbd0']
+    stacks = [(sandbox, matrix[:, idx], stack_colors[idx % len(stack_colors)])
+              for idx, sandbox in enumerate(sandboxes)]
+    cost_points = [
+        (entry['cost']['mean_usd'], entry.get('overall_passes_mean', 0.0), model)
+        for model, entry in summary['per_model'].items()
+        if entry['cost'].get('mean_usd') is not None
+    ]
+
+    charts = {
+        'architecture_benchmark_matrix_multi.png': render_heatmap_svg(
+            matrix, summary['_matrix_observed'], models, sandboxes, len(tasks),
+            'Architecture Benchmark (Multi-Run): Mean Passes per Sandbox (out of 3)'),
+        'architecture_benchmark_model_totals_multi.png': render_bar_svg(
+            models, model_totals, model_max,
+            'Architecture Benchmark (Multi-Run): Mean Passes by Model', 'Mean Passes (out of 9)'),
+        'architecture_benchmark_model_stacked_multi.png': render_stacked_bar_svg(
+            models, stacks, model_max,
+            'Architecture Benchmark (Multi-Run): Passes by Model and Sandbox', 'Mean Passes (out of 9)'),
+        'architecture_benchmark_sandbox_totals_multi.png': render_bar_svg(
+            sandboxes, sandbox_totals, sandbox_max,
+            'Architecture Benchmark (Multi-Run): Mean Passes by Sandbox', 'Mean Passes (out of 9)'),
+        'architecture_benchmark_summary_multi.png': render_panes_svg(
+            bar_chart_svg(models, [(None, model_totals / model_max, None)], 1,
+                          'Pass Rate by Model (Multi-Run)', 'Pass Rate'),
+            bar_chart_svg(sandboxes, [(None, sandbox_totals / sandbox_max, None)], 1,
+                          'Pass Rate by Sandbox (Multi-Run)', 'Pass Rate')),
+        'architecture_benchmark_rubric_model.png': render_bar_svg(
+            models, summary['_rubric_model_means'], 1,
+            'Architecture Benchmark: Rubric Score by Model', 'Mean Rubric Score (0-1)'),
+    }
+    if cost_points:
+        charts['architecture_benchmark_cost_curve.png'] = render_scatter_svg(
+            cost_points, model_max, 'Architecture Benchmark: Cost vs Performance',
+            'Mean Cost per Run (USD)', 'Mean Passes (out of 9)')
+    for name, svg in charts.items():
+        svg_name = Path(name).with_suffix('.svg').name
+        (OUTPUT_DIR / apply_suffix(svg_name, suffix)).write_text(svg)
+
+
 def plot_charts(summary, suffix=None):
+    if PLOT_BACKEND == 'svg':
+        return plot_charts_svg(summary, suffix)
+
+    # imported here so the svg backend never pays for matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.cm import ScalarMappable
+    from matplotlib.colors import Normalize
+    from matplotlib.figure import Figure
+
     out_dir = OUTPUT_DIR
     models = summary['models']
     sandboxes = summary['sandboxes']
     tasks = summary['tasks']
 
     # matrix: mean passes per sandbox (out of 3)
-    matrix = np.zeros((len(models), len(sandboxes)), dtype=float)
-    for i, model in enumerate(models):
-        for j, sandbox in enumerate(sandboxes):
-            matrix[i, j] = summary['per_model'][model]['sandbox_passes_mean'][sandbox]
-
-    fig, ax = plt.subplots(figsize=(7.5, 3.2))
-    img = ax.imshow(matrix, cmap='Blues', vmin=0, vmax=len(tasks))
+    matrix = summary['_matrix_mean_passes']
+    observed = summary['_matrix_observed']
+    model_totals = summary['_model_totals']
+    sandbox_totals = summary['_sandbox_totals']
+
+    # one figure, cleared and resized for each chart; margins are fixed per
+    # chart (sized for the longest model/sandbox labels) instead of tight_layout.
+    # Built directly on an Agg canvas so pyplot's figure manager never gets involved
+    fig = Figure()
+    FigureCanvasAgg(fig)
+
+    # each chart's digest covers its data, the labels, the save options and
+    # this script, so a chart whose inputs did not change keeps its PNG
+    hashes_path = out_dir / '.chart_hashes.json'
+    try:
+        hashes = json.loads(hashes_path.read_text())
+    except (OSError, ValueError):
+        hashes = {}  # missing or damaged cache: redraw everything
+    if not isinstance(hashes, dict):
+        hashes = {}
+    base = chart_digest(Path(__file__).read_bytes(), SAVE_KW, models, sandboxes, tasks)
+
+    out_paths = {name: out_dir / apply_suffix(name, suffix) for name in CHART_NAMES}
+
+    def save(name, *inputs):
+        path = out_paths[name]
+        digest = chart_digest(base, *inputs)
+        if hashes.get(path.name) == digest and path.exists():
+            return
+        fig.savefig(path, **SAVE_KW)
+        hashes[path.name] = digest
+
+    ax = reset_figure(fig, (7.5, 3.2))
+    # map cells to RGBA up front; the colorbar reuses the same mappable
+    scale = ScalarMappable(norm=Normalize(vmin=0, vmax=len(tasks)), cmap='Blues')
+    ax.imshow(scale.to_rgba(matrix))
     ax.set_xticks(range(len(sandboxes)))
     ax.set_xticklabels(sandboxes)
     ax.set_yticks(range(len(models)))
     ax.set_yticklabels(models)
     ax.set_title('Architecture Benchmark (Multi-Run): Mean Passes per Sandbox (out of 3)')
 
-    for i in range(matrix.shape[0]):
-        for j in range(matrix.shape[1]):
-            ax.text(j, i, f"{matrix[i, j]:.2f}/3", ha='center', va='center', color='black')
+    # cells with no runs stay unlabelled so they don't read as 0.00/3
+    labels = np.char.add(np.char.mod('%.2f', matrix), '/3')
+    for i, j in zip(*np.nonzero(observed)):
+        ax.text(j, i, labels[i, j], ha='center', va='center', color='black')
 
-    cbar = fig.colorbar(img, ax=ax, fraction=0.046, pad=0.04)
+    cbar = fig.colorbar(scale, ax=ax, fraction=0.046, pad=0.04)
     cbar.set_label('Mean Passes (0-3)')
-    fig.tight_layout()
-    fig.savefig(out_dir / apply_suffix('architecture_benchmark_matrix_multi.png', suffix), dpi=200)
-    plt.close(fig)
+    fig.subplots_adjust(left=0.26, right=0.93, top=0.88, bottom=0.08)
+    save('architecture_benchmark_matrix_multi.png', matrix, observed)
 
     # model totals (mean passes out of 9)
-    model_totals = matrix.sum(axis=1)
     model_max = len(sandboxes) * len(tasks)
-    fig, ax = plt.subplots(figsize=(6.5, 3.6))
-    ax.bar(range(len(models)), model_totals, color=['#7aa6c2', '#4f7fa3', '#2b5c84'])
+    ax = reset_figure(fig, (6.5, 3.6))
+    bars = ax.bar(range(len(models)), model_totals, color=['#7aa6c2', '#4f7fa3', '#2b5c84'])
     ax.set_xticks(range(len(models)))
     ax.set_xticklabels(models, rotation=20, ha='right')
     ax.set_ylim(0, model_max)
     ax.set_ylabel('Mean Passes (out of 9)')
     ax.set_title('Architecture Benchmark (Multi-Run): Mean Passes by Model')
-    for i, v in enumerate(model_totals):
-        ax.text(i, v + 0.1, f"{v:.2f}", ha='center', va='bottom')
-    fig.tight_layout()
-    fig.savefig(out_dir / apply_suffix('architecture_benchmark_model_totals_multi.png', suffix), dpi=200)
-    plt.close(fig)
+    ax.bar_label(bars, fmt='%.2f', padding=2)
+    fig.subplots_adjust(left=0.31, right=0.97, top=0.90, bottom=0.34)
+    save('architecture_benchmark_model_totals_multi.png', model_totals)
 
     # model stacked by sandbox
-    fig, ax = plt.subplots(figsize=(6.5, 3.6))
+    ax = reset_figure(fig, (6.5, 3.6))
     colors = ['#5e8aa8', '#7aa6c2', '#9bbbd0']
     stack_bottom = np.zeros(len(models))
     for idx, sandbox in enumerate(sandboxes):
@@ -402,74 +802,59 @@ def plot_charts(summary, suffix=None):
     ax.set_ylabel('Mean Passes (out of 9)')
     ax.set_title('Architecture Benchmark (Multi-Run): Passes by Model and Sandbox')
     ax.legend(frameon=False)
-    fig.tight_layout()
-    fig.savefig(out_dir / apply_suffix('architecture_benchmark_model_stacked_multi.png', suffix), dpi=200)
-    plt.close(fig)
+    fig.subplots_adjust(left=0.31, right=0.97, top=0.90, bottom=0.34)
+    save('architecture_benchmark_model_stacked_multi.png', matrix)
 
     # sandbox totals
-    sandbox_totals = matrix.sum(axis=0)
     sandbox_max = len(models) * len(tasks)
-    fig, ax = plt.subplots(figsize=(5.2, 3.6))
-    ax.bar(range(len(sandboxes)), sandbox_totals, color=['#7aa6c2', '#4f7fa3', '#2b5c84'])
+    ax = reset_figure(fig, (5.2, 3.6))
+    bars = ax.bar(range(len(sandboxes)), sandbox_totals, color=['#7aa6c2', '#4f7fa3', '#2b5c84'])
     ax.set_xticks(range(len(sandboxes)))
     ax.set_xticklabels(sandboxes)
     ax.set_ylim(0, sandbox_max)
     ax.set_ylabel('Mean Passes (out of 9)')
     ax.set_title('Architecture Benchmark (Multi-Run): Mean Passes by Sandbox')
-    for i, v in enumerate(sandbox_totals):
-        ax.text(i, v + 0.1, f"{v:.2f}", ha='center', va='bottom')
-    fig.tight_layout()
-    fig.savefig(out_dir / apply_suffix('architecture_benchmark_sandbox_totals_multi.png', suffix), dpi=200)
-    plt.close(fig)
+    ax.bar_label(bars, fmt='%.2f', padding=2)
+    fig.subplots_adjust(left=0.15, right=0.97, top=0.90, bottom=0.11)
+    save('architecture_benchmark_sandbox_totals_multi.png', sandbox_totals)
 
     # summary pass rates
-    fig, axes = plt.subplots(1, 2, figsize=(8.8, 3.2))
+    axes = reset_figure(fig, (8.8, 3.2), ncols=2)
     model_rates = model_totals / model_max
     sandbox_rates = sandbox_totals / sandbox_max
 
-    axes[0].bar(range(len(models)), model_rates, color=['#7aa6c2', '#4f7fa3', '#2b5c84'])
+    bars = axes[0].bar(range(len(models)), model_rates, color=['#7aa6c2', '#4f7fa3', '#2b5c84'])
     axes[0].set_xticks(range(len(models)))
     axes[0].set_xticklabels(models, rotation=20, ha='right')
     axes[0].set_ylim(0, 1)
     axes[0].set_title('Pass Rate by Model (Multi-Run)')
     axes[0].set_ylabel('Pass Rate')
-    for i, v in enumerate(model_rates):
-        axes[0].text(i, v + 0.02, f"{v:.2f}", ha='center', va='bottom', fontsize=9)
+    axes[0].bar_label(bars, fmt='%.2f', padding=2, fontsize=9)
 
-    axes[1].bar(range(len(sandboxes)), sandbox_rates, color=['#7aa6c2', '#4f7fa3', '#2b5c84'])
+    bars = axes[1].bar(range(len(sandboxes)), sandbox_rates, color=['#7aa6c2', '#4f7fa3', '#2b5c84'])
     axes[1].set_xticks(range(len(sandboxes)))
     axes[1].set_xticklabels(sandboxes)
     axes[1].set_ylim(0, 1)
     axes[1].set_title('Pass Rate by Sandbox (Multi-Run)')
     axes[1].set_ylabel('Pass Rate')
-    for i, v in enumerate(sandbox_rates):
-        axes[1].text(i, v + 0.02, f"{v:.2f}", ha='center', va='bottom', fontsize=9)
+    axes[1].bar_label(bars, fmt='%.2f', padding=2, fontsize=9)
 
-    fig.tight_layout()
-    fig.savefig(out_dir / apply_suffix('architecture_benchmark_summary_multi.png', suffix), dpi=200)
-    plt.close(fig)
+    fig.subplots_adjust(left=0.25, right=0.98, top=0.88, bottom=0.38, wspace=0.23)
+    save('architecture_benchmark_summary_multi.png', model_totals, sandbox_totals)
 
-    # rubric summary (mean total score by model)
-    rubric_scores = []
-    for model in models:
-        sandbox_scores = []
-        for sandbox in sandboxes:
-            entry = summary['per_model'][model]['rubric'].get(sandbox, {})
-            sandbox_scores.append(entry.get('mean', 0.0))
-        rubric_scores.append(sum(sandbox_scores) / len(sandbox_scores) if sandbox_scores else 0.0)
-
-    fig, ax = plt.subplots(figsize=(6.2, 3.4))
-    ax.bar(range(len(models)), rubric_scores, color=['#7aa6c2', '#4f7fa3', '#2b5c84'][:len(models)])
+    # rubric summary (mean total score by model, averaged over sandboxes)
+    rubric_scores = summary['_rubric_model_means']
+
+    ax = reset_figure(fig, (6.2, 3.4))
+    bars = ax.bar(range(len(models)), rubric_scores, color=['#7aa6c2', '#4f7fa3', '#2b5c84'][:len(models)])
     ax.set_xticks(range(len(models)))
     ax.set_xticklabels(models, rotation=20, ha='right')
     ax.set_ylim(0, 1)
     ax.set_ylabel('Mean Rubric Score (0-1)')
     ax.set_title('Architecture Benchmark: Rubric Score by Model')
-    for i, v in enumerate(rubric_scores):
-        ax.text(i, v + 0.02, f"{v:.2f}", ha='center', va='bottom', fontsize=9)
-    fig.tight_layout()
-    fig.savefig(out_dir / apply_suffix('architecture_benchmark_rubric_model.png', suffix), dpi=200)
-    plt.close(fig)
+    ax.bar_label(bars, fmt='%.2f', padding=2, fontsize=9)
+    fig.subplots_adjust(left=0.32, right=0.97, top=0.89, bottom=0.36)
+    save('architecture_benchmark_rubric_model.png', rubric_scores)
 
     # cost curve (Pareto)
     cost_points = []
@@ -481,7 +866,7 @@ def plot_charts(summary, suffix=None):
         cost_points.append((cost_mean, performance, model))
 
     if cost_points:
-        fig, ax = plt.subplots(figsize=(6.2, 3.6))
+        ax = reset_figure(fig, (6.2, 3.6))
         xs = [p[0] for p in cost_points]
         ys = [p[1] for p in cost_points]
         ax.scatter(xs, ys, color='#2b5c84')
@@ -491,13 +876,17 @@ def plot_charts(summary, suffix=None):
         ax.set_ylabel('Mean Passes (out of 9)')
         ax.set_title('Architecture Benchmark: Cost vs Performance')
         ax.set_ylim(0, len(sandboxes) * len(tasks))
-        fig.tight_layout()
-        fig.savefig(out_dir / apply_suffix('architecture_benchmark_cost_curve.png', suffix), dpi=200)
-        plt.close(fig)
+        fig.subplots_adjust(left=0.15, right=0.91, top=0.90, bottom=0.17)
+        save('architecture_benchmark_cost_curve.png', cost_points)
+
+    # write-then-rename so an interrupted run never leaves a truncated cache
+    tmp_path = hashes_path.with_name(hashes_path.name + '.tmp')
+    tmp_path.write_text(json.dumps(hashes, indent=2, sort_keys=True) + '\n')
+    os.replace(tmp_path, hashes_path)
 
 
 def main():
-    input_dir_arg, suffix = parse_args()
+    input_dir_arg, suffix, force = parse_args()
     input_dir = input_dir_arg or Path(os.environ.get('ARCH_RUN_DIR', ''))
     if not input_dir or str(input_dir) == '.':
         input_dir = latest_runs_dir()
@@ -506,41 +895,53 @@ def main():
         print('No run directory found', file=sys.stderr)
         return
 
+    summary_path = OUTPUT_DIR / apply_suffix('architecture_sampling_summary.json', suffix)
+    fingerprint_path = summary_path.with_suffix('.fingerprint')
+    fingerprint = runs_fingerprint(input_dir) if input_dir.exists() else None
+    if (not force and fingerprint and summary_path.exists() and fingerprint_path.exists()
+            and fingerprint_path.read_text().strip() == fingerprint):
+        print('Runs unchanged since last build; skipping (use --force to rebuild)')
+        return
+
     runs = load_runs(input_dir)
     if not runs:
         print('No runs found in', input_dir)
         return
 
     def collect_dimensions(runs):
-        models = [payload['metadata']['model'] for payload in runs]
-        models_unique = list(dict.fromkeys(models))
-
-        sandboxes = []
+        # dicts keep first-seen order while deduplicating
+        models = {}
+        sandboxes = {}
+        tasks = {}
         for payload in runs:
-            for sandbox in payload.get('metadata', {}).get('sandboxes', []):
-                if sandbox not in sandboxes:
-                    sandboxes.append(sandbox)
-        if not sandboxes:
-            sandboxes = sorted({r['sandbox'] for payload in runs for r in payload.get('results', [])})
-
-        tasks = []
-        for payload in runs:
-            for task in payload.get('metadata', {}).get('tasks', []):
-                if task not in tasks:
-                    tasks.append(task)
-        if not tasks:
-            tasks = sorted({r['task']['id'] for payload in runs for r in payload.get('results', [])})
-
-        return models_unique, sandboxes, tasks
+            metadata = payload['metadata']
+            models[metadata['model']] = None
+            sandboxes.update(dict.fromkeys(metadata.get('sandboxes', [])))
+            tasks.update(dict.fromkeys(metadata.get('tasks', [])))
+
+        # no dimension metadata: one scan over the results fills both
+        if not sandboxes or not tasks:
+            seen_sandboxes = set()
+            seen_tasks = set()
+            for payload in runs:
+                for r in payload.get('results', []):
+                    seen_sandboxes.add(r['sandbox'])
+                    seen_tasks.add(r['task']['id'])
+            sandboxes = sandboxes or sorted(seen_sandboxes)
+            tasks = tasks or sorted(seen_tasks)
+
+        return list(models), list(sandboxes), list(tasks)
 
     models, sandboxes, tasks = collect_dimensions(runs)
 
-    pass_counts, run_counts, run_totals, tool_reads, run_token_usage, rubric_sums, rubric_counts = summarize_runs(runs)
+    (pass_counts, run_counts, run_totals, tool_usage, file_index,
+     run_token_usage, rubric_sums, rubric_counts) = summarize_runs(runs, models, sandboxes, tasks)
     summary = build_summary(
         pass_counts,
         run_counts,
         run_totals,
-        tool_reads,
+        tool_usage,
+        file_index,
         run_token_usage,
         rubric_sums,
         rubric_counts,
@@ -555,6 +956,8 @@ def main():
     plot_charts(summary, suffix)
     print('Charts written to', OUTPUT_DIR)
 
+    fingerprint_path.write_text(fingerprint + '\n')
+
 
 if __name__ == '__main__':
     main()
@@ -8,6 +8,7 @@
  *   node --experimental-strip-types scripts/architecture-benchmark.ts --sandbox=app-typed --model=claude-sonnet-4-20250514
  *   node --experimental-strip-types scripts/architecture-benchmark.ts --sandbox=all --model=qwen/qwen3-coder-next
  *   node --experimental-strip-types scripts/architecture-benchmark.ts --sandbox=all --model=qwen/qwen3-coder-next --drift=stripe-lag
+ *   node --experimental-strip-types scripts/architecture-benchmark.ts --sandbox=all --model=claude-opus-4-5 --run-id=run3
  */
 
 import fs from 'node:fs';
@@ -257,8 +258,10 @@ function copyRecursive(src: string, dest: string): void {
   }
 }
 
-function setupSandboxDir(sandboxId: string, model: string, data: DataBundle): string {
-  const runId = `${sandboxId}-${model.replace(/[/:]/g, '-')}-${Date.now()}`;
+function setupSandboxDir(sandboxId: string, model: string, data: DataBundle, runTag: string): string {
+  // runTag keeps concurrent processes for the same model out of each other's dirs
+  const tag = runTag ? `-${runTag}` : '';
+  const runId = `${sandboxId}-${model.replace(/[/:]/g, '-')}${tag}-${Date.now()}`;
   const sandboxDir = path.join(PROJECT_DIR, 'sandbox-runs', runId);
 
   if (fs.existsSync(sandboxDir)) {
@@ -608,7 +611,8 @@ async function runBenchmark(
   data: DataBundle,
   tasks: Task[],
   lintEnabled: boolean,
-  lintMode: 'full' | 'schema'
+  lintMode: 'full' | 'schema',
+  runTag: string
 ): Promise<BenchmarkResult[]> {
   const results: BenchmarkResult[] = [];
 
@@ -627,7 +631,7 @@ async function runBenchmark(
     for (const task of selectedTasks) {
       console.log(`\n--- Task: ${task.id} ---`);
 
-      const sandboxDir = setupSandboxDir(sandboxId, model, data);
+      const sandboxDir = setupSandboxDir(sandboxId, model, data, runTag);
       console.log(`  Sandbox: ${sandboxDir}`);
 
       const expected = task.expectedValue();
@@ -810,6 +814,7 @@ async function main() {
   const lintEnabled = !args.includes('--no-lint');
   const lintModeArg = args.find(a => a.startsWith('--lint-mode='))?.split('=')[1];
   const lintMode = lintModeArg === 'schema' ? 'schema' : 'full';
+  const runTag = (args.find(a => a.startsWith('--run-id='))?.split('=')[1] ?? '').replace(/[^A-Za-z0-9_.-]/g, '-');
 
   const drift: DriftMode = driftArg || 'none';
 
@@ -831,7 +836,7 @@ async function main() {
   console.log(`Drift:     ${drift}`);
   console.log('='.repeat(70));
 
-  const results = await runBenchmark(sandboxIds, model, taskIds, maxTurns, driftedData, tasks, lintEnabled, lintMode);
+  const results = await runBenchmark(sandboxIds, model, taskIds, maxTurns, driftedData, tasks, lintEnabled, lintMode, runTag);
 
   printSummary(results);
 
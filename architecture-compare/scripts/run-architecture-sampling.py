@@ -3,6 +3,7 @@ import os
 import sys
 import time
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 MODELS = [
@@ -15,6 +16,25 @@ RUNS = 5
 
 OUT_DIR = Path('artifacts/reports/architecture_runs_2026-02-07')
 
+# Runs are API-bound; cap parallelism to stay inside rate limits.
+CONCURRENCY = int(os.environ.get('ARCH_CONCURRENCY', '3'))
+
+
+def run_task(task):
+    model, run_idx, cmd, log_path = task
+    print(f'  {model} run {run_idx}: starting (log: {log_path})', flush=True)
+    start = time.time()
+    try:
+        # each child gets its own log so concurrent runs don't interleave
+        with log_path.open('w') as log:
+            subprocess.run(cmd, check=True, timeout=600, stdout=log, stderr=subprocess.STDOUT)
+        elapsed = time.time() - start
+        return f'  {model} run {run_idx}: complete in {elapsed:.1f}s', False
+    except subprocess.TimeoutExpired:
+        return f'  {model} run {run_idx}: TIMEOUT', True
+    except subprocess.CalledProcessError as exc:
+        return f'  {model} run {run_idx}: FAILED (exit {exc.returncode})', True
+
 
 def main():
     api_key = os.environ.get('ANTHROPIC_API_KEY')
@@ -24,13 +44,14 @@ def main():
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    for model in MODELS:
-        print(f'\n=== Model: {model} ===')
-        safe_model = model.replace('/', '-')
-        for run_idx in range(1, RUNS + 1):
+    # run-major order, so the runs in flight at once are different models
+    tasks = []
+    for run_idx in range(1, RUNS + 1):
+        for model in MODELS:
+            safe_model = model.replace('/', '-')
             output_path = OUT_DIR / f'{safe_model}-run{run_idx}.json'
             if output_path.exists():
-                print(f'  Run {run_idx}: exists, skipping')
+                print(f'  {model} run {run_idx}: exists, skipping')
                 continue
 
             cmd = [
@@ -40,18 +61,19 @@ def main():
                 '--sandbox=all',
                 f'--model={model}',
                 f'--output={output_path.as_posix()}',
+                f'--run-id=run{run_idx}',
             ]
+            tasks.append((model, run_idx, cmd, output_path.with_suffix('.log')))
+
+    if not tasks:
+        return
 
-            print(f'  Run {run_idx}: starting')
-            start = time.time()
-            try:
-                subprocess.run(cmd, check=True, timeout=600)
-                elapsed = time.time() - start
-                print(f'  Run {run_idx}: complete in {elapsed:.1f}s')
-            except subprocess.TimeoutExpired:
-                print(f'  Run {run_idx}: TIMEOUT', file=sys.stderr)
-            except subprocess.CalledProcessError as exc:
-                print(f'  Run {run_idx}: FAILED (exit {exc.returncode})', file=sys.stderr)
+    print(f'\n=== {len(tasks)} runs, {CONCURRENCY} at a time ===')
+    with ThreadPoolExecutor(max_workers=max(1, CONCURRENCY)) as pool:
+        futures = [pool.submit(run_task, task) for task in tasks]
+        for future in as_completed(futures):
+            message, failed = future.result()
+            print(message, file=sys.stderr if failed else sys.stdout)
 
 
 if __name__ == '__main__':